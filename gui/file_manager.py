@@ -0,0 +1,38 @@
+"""
+Open folders in the platform file manager
+"""
+
+import os
+import platform
+import subprocess
+
+from gui.logger import log
+
+
+# Platform and file manager command (non-Windows), resolved once at import
+_SYSTEM = platform.system()
+_OPEN_CMD = ("open",) if _SYSTEM == "Darwin" else ("xdg-open",)
+
+
+def open_folder(folder):
+    """
+    Open folder in the file manager without blocking the Tk loop.
+
+    Returns False (and logs why) if the file manager could not be started.
+    """
+    try:
+        if _SYSTEM == "Windows":
+            # Let the shell open it rather than spawning explorer.exe ourselves
+            os.startfile(os.fspath(folder))
+        else:
+            subprocess.Popen(
+                (*_OPEN_CMD, os.fspath(folder)),
+                close_fds=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+    except OSError as e:
+        log(f"Could not open folder {folder}: {e}")
+        return False
+    return True
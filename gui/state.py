@@ -13,6 +13,60 @@ from gui.logger import log
 
 DEFAULT_PROGRAM_VERSION = APP_VERSION
 
+# Number of appended state deltas before the snapshot is rewritten
+GUI_STATE_COMPACT_EVERY = 50
+
+
+def delta_file_for(state_file: Path) -> Path:
+    """Path of the append-only delta log that sits next to a GUI state file"""
+    return state_file.with_name(state_file.stem + ".delta.jsonl")
+
+
+def append_state_delta(state_file: Path, key: str, value) -> None:
+    """Append a single-key change to the delta log of a GUI state file"""
+    with open(delta_file_for(state_file), 'a', encoding='utf-8') as f:
+        f.write(json.dumps({"k": key, "v": value}, ensure_ascii=False) + "\n")
+
+
+def read_state_with_deltas(state_file: Path) -> dict:
+    """Load a GUI state snapshot and replay its delta log on top
+
+    Unreadable delta lines (e.g. a write cut short by a crash) are skipped.
+    """
+    state = {}
+    if state_file.exists():
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+
+    delta_file = delta_file_for(state_file)
+    if delta_file.exists():
+        with open(delta_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    state[record["k"]] = record["v"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+
+    return state
+
+
+def clear_state_deltas(state_file: Path) -> None:
+    """Drop the delta log once a full snapshot has been written"""
+    delta_file_for(state_file).unlink(missing_ok=True)
+
+
+def dedupe_creators(names) -> list:
+    """Remove case-insensitive duplicate creator names, keeping first seen"""
+    seen = set()
+    deduped = []
+    for name in names:
+        key = name.lower()
+        if key not in seen:
+            seen.add(key)
+            deduped.append(name)
+    return deduped
+
 
 class AppState:
     """Centralized application state for GUI"""
@@ -28,6 +82,7 @@ class AppState:
 
         # GUI state file path (separate from config.ini)
         self.gui_state_file = Path.cwd() / "gui_state.json"
+        self._delta_count = 0  # Deltas appended since the last full save
 
         # Load config from file
         self.load_config_file()
@@ -59,22 +114,13 @@ class AppState:
         self.current_creator = None
 
     def load_gui_state(self):
-        """Load GUI-specific state from gui_state.json"""
+        """Load GUI-specific state from gui_state.json plus pending deltas"""
         try:
-            if self.gui_state_file.exists():
-                with open(self.gui_state_file, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-                    loaded = state.get("creators", [])
-                    seen = set()
-                    deduped = []
-                    for name in loaded:
-                        key = name.lower()
-                        if key not in seen:
-                            seen.add(key)
-                            deduped.append(name)
-                    self.all_creators = deduped
-                    self.selected_creators = set(state.get("selected", []))
-                    print(f"Loaded {len(self.all_creators)} creators from GUI state")
+            state = read_state_with_deltas(self.gui_state_file)
+            if state:
+                self.all_creators = dedupe_creators(state.get("creators", []))
+                self.selected_creators = set(state.get("selected", []))
+                print(f"Loaded {len(self.all_creators)} creators from GUI state")
         except Exception as ex:
             print(f"GUI state load error: {ex}")
             # Default to empty if load fails
@@ -90,10 +136,25 @@ class AppState:
             }
             with open(self.gui_state_file, 'w', encoding='utf-8') as f:
                 json.dump(state, f, indent=2, ensure_ascii=False)
+            clear_state_deltas(self.gui_state_file)
+            self._delta_count = 0
             print(f"Saved {len(self.all_creators)} creators to GUI state")
         except Exception as ex:
             print(f"GUI state save error: {ex}")
 
+    def save_gui_state_delta(self, key, value):
+        """Persist one changed key by appending to the delta log
+
+        The full snapshot is rewritten every GUI_STATE_COMPACT_EVERY deltas.
+        """
+        try:
+            append_state_delta(self.gui_state_file, key, value)
+            self._delta_count += 1
+            if self._delta_count >= GUI_STATE_COMPACT_EVERY:
+                self.save_gui_state()
+        except Exception as ex:
+            print(f"GUI state delta save error: {ex}")
+
 
 class OnlyFansAppState:
     """Application state for OnlyFans tab"""
@@ -109,6 +170,7 @@ class OnlyFansAppState:
 
         # GUI state file (separate from Fansly)
         self.gui_state_file = Path.cwd() / "onlyfans_gui_state.json"
+        self._delta_count = 0  # Deltas appended since the last full save
 
         # Load config
         self.load_config_file()
@@ -137,21 +199,12 @@ class OnlyFansAppState:
         self.current_creator = None
 
     def load_gui_state(self):
-        """Load OF GUI state from json"""
+        """Load OF GUI state from json plus pending deltas"""
         try:
-            if self.gui_state_file.exists():
-                with open(self.gui_state_file, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-                    loaded = state.get("creators", [])
-                    seen = set()
-                    deduped = []
-                    for name in loaded:
-                        key = name.lower()
-                        if key not in seen:
-                            seen.add(key)
-                            deduped.append(name)
-                    self.all_creators = deduped
-                    self.selected_creators = set(state.get("selected", []))
+            state = read_state_with_deltas(self.gui_state_file)
+            if state:
+                self.all_creators = dedupe_creators(state.get("creators", []))
+                self.selected_creators = set(state.get("selected", []))
         except Exception as ex:
             print(f"OF GUI state load error: {ex}")
             self.all_creators = []
@@ -166,5 +219,17 @@ class OnlyFansAppState:
             }
             with open(self.gui_state_file, 'w', encoding='utf-8') as f:
                 json.dump(state, f, indent=2, ensure_ascii=False)
+            clear_state_deltas(self.gui_state_file)
+            self._delta_count = 0
         except Exception as ex:
             print(f"OF GUI state save error: {ex}")
+
+    def save_gui_state_delta(self, key, value):
+        """Persist one changed key by appending to the delta log"""
+        try:
+            append_state_delta(self.gui_state_file, key, value)
+            self._delta_count += 1
+            if self._delta_count >= GUI_STATE_COMPACT_EVERY:
+                self.save_gui_state()
+        except Exception as ex:
+            print(f"OF GUI state delta save error: {ex}")
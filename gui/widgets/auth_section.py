@@ -2,11 +2,38 @@
 Authentication section widget
 """
 
+import json
+import re
 import customtkinter as ctk
 import threading
 from gui.logger import log
 
 
+# Pulls the token out of a pasted cookie JSON blob without a full parse;
+# values with escape sequences are left to json.loads
+_TOKEN_RE = re.compile(r'"token"\s*:\s*"([^"\\]+)"')
+
+
+def _extract_token(token):
+    """Return the token value if a whole cookie JSON blob was pasted"""
+    if token[:1] != '{' or token[-1:] != '}':
+        return token
+
+    match = _TOKEN_RE.search(token)
+    if match:
+        return match.group(1)
+
+    # Regex missed (unusual formatting), fall back to a strict parse
+    try:
+        token_data = json.loads(token)
+    except (json.JSONDecodeError, ValueError):
+        return token  # Not valid JSON, use as-is
+
+    if isinstance(token_data, dict) and isinstance(token_data.get('token'), str):
+        return token_data['token']
+    return token
+
+
 class AuthSection(ctk.CTkFrame):
     """Authentication configuration section"""
 
@@ -90,18 +117,13 @@ class AuthSection(ctk.CTkFrame):
         token = self.token_entry.get().strip()
         user_agent = self.user_agent_entry.get().strip()
 
-        # Try to parse token as JSON (in case user copied the entire cookie value)
-        if token.startswith('{') and token.endswith('}'):
-            try:
-                import json
-                token_data = json.loads(token)
-                if 'token' in token_data:
-                    token = token_data['token']
-                    # Update the entry with the extracted token
-                    self.token_entry.delete(0, 'end')
-                    self.token_entry.insert(0, token)
-            except json.JSONDecodeError:
-                pass  # Not valid JSON, use as-is
+        # Extract token from JSON (in case user copied the entire cookie value)
+        extracted_token = _extract_token(token)
+        if extracted_token != token:
+            token = extracted_token
+            # Update the entry with the extracted token
+            self.token_entry.delete(0, 'end')
+            self.token_entry.insert(0, token)
 
         # Validate fields
         if not token:
@@ -227,21 +249,9 @@ class AuthSection(ctk.CTkFrame):
         if len(token) > MAX_INPUT_SIZE:
             token = token[:MAX_INPUT_SIZE]
 
-        # Try to parse as JSON (in case user copied the entire cookie value)
-        if token.startswith('{') and token.endswith('}'):
-            try:
-                import json
-                # Limit JSON parsing to prevent memory exhaustion
-                if len(token) > MAX_INPUT_SIZE:
-                    raise ValueError("Token too large for JSON parsing")
-                token_data = json.loads(token)
-                if 'token' in token_data:
-                    extracted_token = token_data['token']
-                    # Validate extracted token size
-                    if isinstance(extracted_token, str) and len(extracted_token) <= MAX_INPUT_SIZE:
-                        token = extracted_token
-            except (json.JSONDecodeError, ValueError, TypeError):
-                pass  # Not valid JSON or too large, use as-is
+        # Extract token from JSON (in case user copied the entire cookie value).
+        # Input is already capped above, so the extracted value is too.
+        token = _extract_token(token)
 
         config.token = token
         user_agent = self.user_agent_entry.get().strip()
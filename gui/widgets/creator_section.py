@@ -3,19 +3,25 @@ Creator selection widget with checkbox-based multi-select
 """
 
 import customtkinter as ctk
+import sys
 import threading
+from functools import partial
 from tkinter import messagebox
 
 
 class CreatorSection(ctk.CTkFrame):
     """Creator username input section with checkbox-based selection"""
 
+    # Height of one creator row in the list (unscaled pixels)
+    ROW_HEIGHT = 32
+
     def __init__(self, parent, config, app_state, import_callback=None):
         super().__init__(parent)
         self.config = config
         self.app_state = app_state  # Reference to app state for persistence
         self.creators = []  # List of all creator usernames
-        self.creator_widgets = {}  # Dict: username -> {checkbox, frame, var}
+        self._creator_set = set()  # Same usernames, for O(1) membership checks
+        self._selected = set()  # Checked usernames, mirrored from the checkboxes
         self.import_callback = import_callback  # Callback for subscription import
 
         # Title
@@ -76,17 +82,32 @@ class CreatorSection(ctk.CTkFrame):
             )
             self.import_subs_btn.pack(side="left", padx=3)
 
-        # Scrollable frame for creator checkboxes
-        self.scroll_frame = ctk.CTkScrollableFrame(self, height=400)
-        self.scroll_frame.grid(
+        # Virtualized creator list: only rows inside the viewport exist as
+        # widgets, and they are re-pointed at different creators on scroll
+        list_frame = ctk.CTkFrame(self)
+        list_frame.grid(
             row=3, column=0, columnspan=3, padx=10, pady=5, sticky="nsew"
         )
+        list_frame.grid_columnconfigure(0, weight=1)
+        list_frame.grid_rowconfigure(0, weight=1)
+
+        self.viewport = ctk.CTkFrame(list_frame, height=400, fg_color="transparent")
+        self.viewport.grid(row=0, column=0, sticky="nsew")
+        self.viewport.bind("<Configure>", lambda e: self._render_rows())
+        self._bind_mouse_wheel(self.viewport)
+
+        self.scrollbar = ctk.CTkScrollbar(list_frame, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self._rows = []  # Row widget dicts, reused for whichever creators are visible
+        self._scroll_y = 0  # Scroll offset in unscaled pixels
 
         # Info label
         self.info_label = ctk.CTkLabel(
             self, text="Add creator usernames to download", text_color="gray", anchor="w"
         )
         self.info_label.grid(row=4, column=0, columnspan=3, padx=10, pady=5, sticky="w")
+        self._last_info = ("Add creator usernames to download", "gray")
 
         # Configure grid weights
         self.grid_columnconfigure(1, weight=1)
@@ -94,10 +115,9 @@ class CreatorSection(ctk.CTkFrame):
         
         # Debouncing for save operations
         self._save_timer_id = None
-        
-        # Batched widget creation state
-        self._widget_creation_queue = None
-        self._selected_set = None
+
+        # Set while a bulk operation runs so per-creator updates are skipped
+        self._bulk_updating = False
 
         # Load from config
         self.load_from_config()
@@ -107,19 +127,21 @@ class CreatorSection(ctk.CTkFrame):
         username = self.username_entry.get().strip()
 
         if not username:
-            self.info_label.configure(text="⚠ Enter a username first", text_color="red")
+            self._set_info(text="⚠ Enter a username first", text_color="red")
             return
 
         # Check for duplicates
-        if username in self.creators:
-            self.info_label.configure(
+        if username in self._creator_set:
+            self._set_info(
                 text=f"⚠ @{username} is already in the list", text_color="orange"
             )
             return
 
         # Add to list
         self.creators.append(username)
-        self.create_creator_row(username, checked=True)  # AUTO-CHECKED
+        self._creator_set.add(username)
+        self._selected.add(username)  # AUTO-CHECKED
+        self._render_rows()
 
         # Clear entry
         self.username_entry.delete(0, "end")
@@ -130,18 +152,18 @@ class CreatorSection(ctk.CTkFrame):
         # Save immediately for explicit add action
         self._sync_and_save(immediate=True)
 
-    def create_creator_row(self, username, checked=False):
-        """Create a single row with checkbox, label, and remove button"""
-        row_frame = ctk.CTkFrame(self.scroll_frame)
-        row_frame.pack(fill="x", padx=5, pady=2)
+    def _build_creator_row(self):
+        """Build the widgets for one list row (not bound to a creator yet)"""
+        row = {"username": None}
 
-        # Checkbox
-        checkbox_var = ctk.BooleanVar(value=checked)
+        row_frame = ctk.CTkFrame(self.viewport, height=self.ROW_HEIGHT - 4)
+        row_frame.pack_propagate(False)
+
+        # Checkbox (no Tk variable; the selection set is the model)
         checkbox = ctk.CTkCheckBox(
             row_frame,
-            text=f"@{username}",
-            variable=checkbox_var,
-            command=self.on_selection_changed,
+            text="",
+            command=partial(self._on_row_toggled, row),
         )
         checkbox.pack(side="left", fill="x", expand=True, padx=5)
 
@@ -153,29 +175,114 @@ class CreatorSection(ctk.CTkFrame):
             height=24,
             fg_color="red",
             hover_color="darkred",
-            command=lambda: self.remove_creator_by_name(username),
+            command=partial(self._on_row_remove, row),
         )
         remove_btn.pack(side="right", padx=5)
 
-        # Store widgets
-        self.creator_widgets[username] = {
-            "frame": row_frame,
-            "checkbox": checkbox,
-            "var": checkbox_var,
-        }
+        for widget in (row_frame, checkbox, remove_btn):
+            self._bind_mouse_wheel(widget)
+
+        row.update(frame=row_frame, checkbox=checkbox)
+        return row
+
+    def _render_rows(self):
+        """Point the visible rows at the creators inside the current viewport"""
+        scaling = ctk.ScalingTracker.get_widget_scaling(self.viewport)
+        view_height = self.viewport.winfo_height() / scaling
+        total_height = len(self.creators) * self.ROW_HEIGHT
+
+        # Keep the offset valid after resizes and removals
+        self._scroll_y = max(0, min(self._scroll_y, total_height - view_height))
+
+        first = int(self._scroll_y // self.ROW_HEIGHT)
+        visible = min(len(self.creators) - first, int(view_height // self.ROW_HEIGHT) + 2)
+        while len(self._rows) < visible:
+            self._rows.append(self._build_creator_row())
+
+        for slot, row in enumerate(self._rows):
+            if slot >= visible:
+                if row["username"] is not None:
+                    row["frame"].place_forget()
+                    row["username"] = None
+                continue
+
+            index = first + slot
+            username = self.creators[index]
+            if row["username"] != username:
+                row["checkbox"].configure(text=f"@{username}")
+                row["username"] = username
+            checkbox = row["checkbox"]
+            checked = username in self._selected
+            if bool(checkbox.get()) != checked:
+                if checked:
+                    checkbox.select()
+                else:
+                    checkbox.deselect()
+            row["frame"].place(
+                x=0, y=int(index * self.ROW_HEIGHT - self._scroll_y) + 2, relwidth=1
+            )
+
+        if total_height > view_height:
+            self.scrollbar.set(
+                self._scroll_y / total_height,
+                (self._scroll_y + view_height) / total_height,
+            )
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _scroll_to(self, offset):
+        """Scroll the list to an offset in unscaled pixels"""
+        self._scroll_y = offset
+        self._render_rows()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """Scrollbar command: Tk-style 'moveto'/'scroll' requests"""
+        if action == "moveto":
+            self._scroll_to(float(amount) * len(self.creators) * self.ROW_HEIGHT)
+        elif unit == "pages":
+            scaling = ctk.ScalingTracker.get_widget_scaling(self.viewport)
+            page = self.viewport.winfo_height() / scaling
+            self._scroll_to(self._scroll_y + int(amount) * page)
+        else:
+            self._scroll_to(self._scroll_y + int(amount) * self.ROW_HEIGHT)
+
+    def _on_mouse_wheel(self, event):
+        """Scroll the list by wheel notches (same step sizes as CTkScrollbar)"""
+        if sys.platform.startswith("win"):
+            delta = -int(event.delta / 40)
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -1 if event.num == 4 else 1
+        self._scroll_to(self._scroll_y + delta * self.ROW_HEIGHT)
+
+    def _bind_mouse_wheel(self, widget):
+        """Route wheel events over a widget to the creator list"""
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_mouse_wheel, add="+")
+
+    def _on_row_remove(self, row):
+        """Remove button callback for whichever creator the row shows"""
+        if row["username"] is not None:
+            self.remove_creator_by_name(row["username"])
 
     def remove_creator_by_name(self, username):
         """Remove a specific creator by username"""
-        if username not in self.creators:
+        if username not in self._creator_set:
             return
 
-        # Remove from list
-        self.creators.remove(username)
+        # Remove from list (bulk callers rebuild the list once afterwards)
+        self._creator_set.discard(username)
+        if not self._bulk_updating:
+            self.creators.remove(username)
+
+        self._selected.discard(username)
+
+        # Bulk callers redraw, update the label and save once when they finish
+        if self._bulk_updating:
+            return
 
-        # Destroy widgets
-        if username in self.creator_widgets:
-            self.creator_widgets[username]["frame"].destroy()
-            del self.creator_widgets[username]
+        self._render_rows()
 
         # Update info
         self.update_info_label()
@@ -185,14 +292,14 @@ class CreatorSection(ctk.CTkFrame):
 
     def select_all(self):
         """Select all creators"""
-        for username, widgets in self.creator_widgets.items():
-            widgets["var"].set(True)
+        self._selected = set(self.creators)
+        self._render_rows()
         self.on_selection_changed()
 
     def deselect_all(self):
         """Deselect all creators"""
-        for username, widgets in self.creator_widgets.items():
-            widgets["var"].set(False)
+        self._selected.clear()
+        self._render_rows()
         self.on_selection_changed()
 
     def remove_selected(self):
@@ -200,7 +307,7 @@ class CreatorSection(ctk.CTkFrame):
         selected = self.get_selected_creators()
 
         if not selected:
-            self.info_label.configure(text="⚠ No creators selected to remove", text_color="orange")
+            self._set_info(text="⚠ No creators selected to remove", text_color="orange")
             return
 
         # Confirm removal
@@ -212,18 +319,35 @@ class CreatorSection(ctk.CTkFrame):
         ):
             return
 
-        # Remove each selected creator
-        for username in selected:
-            self.remove_creator_by_name(username)
-
-        self.info_label.configure(
+        # Remove each selected creator, deferring label updates and saves
+        self._bulk_updating = True
+        try:
+            for username in selected:
+                self.remove_creator_by_name(username)
+        finally:
+            self._bulk_updating = False
+            self.creators = [c for c in self.creators if c in self._creator_set]
+            self._render_rows()
+
+        self._set_info(
             text=f"✓ Removed {count} creator{'s' if count != 1 else ''}",
             text_color="green"
         )
 
-        # Save changes (already saved by remove_creator_by_name, but ensure final state is saved)
+        # Single save for the whole batch
         self._sync_and_save(immediate=True)
 
+    def _on_row_toggled(self, row):
+        """Checkbox callback: mirror the new state into the selection set"""
+        username = row["username"]
+        if username is None:
+            return
+        if row["checkbox"].get():
+            self._selected.add(username)
+        else:
+            self._selected.discard(username)
+        self.on_selection_changed()
+
     def on_selection_changed(self):
         """Called when any checkbox changes"""
         self.update_info_label()
@@ -231,61 +355,80 @@ class CreatorSection(ctk.CTkFrame):
         # Save to gui_state.json (debounced)
         self._sync_and_save()
 
+    def _set_info(self, text, text_color):
+        """Configure the info label, skipping the Tk call if nothing changed"""
+        if (text, text_color) == self._last_info:
+            return
+        self.info_label.configure(text=text, text_color=text_color)
+        self._last_info = (text, text_color)
+
     def update_info_label(self):
         """Update the info label with current selection status"""
         selected_count = len(self.get_selected_creators())
         total_count = len(self.creators)
 
         if total_count == 0:
-            self.info_label.configure(
+            self._set_info(
                 text="Add creator usernames to download", text_color="gray"
             )
         else:
-            self.info_label.configure(
+            self._set_info(
                 text=f"{selected_count}/{total_count} creator{'s' if total_count != 1 else ''} selected",
                 text_color="gray",
             )
 
     def get_selected_creators(self):
         """Get list of currently selected creators"""
-        selected = []
-        for username, widgets in self.creator_widgets.items():
-            if widgets["var"].get():
-                selected.append(username)
-        return selected
+        # Read from the Python-side set; no Tcl variable reads needed
+        return [username for username in self.creators if username in self._selected]
 
     def _sync_and_save(self, immediate=False):
         """Sync current widget state to AppState and save to JSON
-        
+
+        AppState is updated right away; only the disk write is debounced so
+        bursts of toggles collapse into a single save.
+
         Args:
-            immediate: If True, save immediately. If False, debounce (default).
+            immediate: If True, write the full state now. If False (default),
+                debounce and append only the selection to the delta log.
         """
+        # Keep AppState current so any other saver sees the latest selection
+        self.app_state.all_creators = self.creators.copy()
+        self.app_state.selected_creators = set(self.get_selected_creators())
+
+        # Cancel any pending save
+        if self._save_timer_id is not None:
+            self.after_cancel(self._save_timer_id)
+            self._save_timer_id = None
+
         if immediate:
-            # Cancel any pending save
-            if self._save_timer_id is not None:
-                self.after_cancel(self._save_timer_id)
-                self._save_timer_id = None
-            
-            # Save immediately
             self._do_save()
         else:
-            # Debounce: cancel previous timer and schedule new one
-            if self._save_timer_id is not None:
-                self.after_cancel(self._save_timer_id)
-            
             # Schedule save after 500ms delay
-            self._save_timer_id = self.after(500, self._do_save)
-    
+            self._save_timer_id = self.after(500, self._do_selection_save)
+
     def _do_save(self):
         """Actually perform the save operation"""
         self._save_timer_id = None
-        # Update AppState with current widget state
-        self.app_state.all_creators = self.creators.copy()
-        self.app_state.selected_creators = set(self.get_selected_creators())
-
-        # Save to JSON file
         self.app_state.save_gui_state()
 
+    def _do_selection_save(self):
+        """Debounced save: only the selection changed, so append a delta"""
+        self._save_timer_id = None
+        self.app_state.save_gui_state_delta(
+            "selected", list(self.app_state.selected_creators)
+        )
+
+    def cancel_pending_save(self):
+        """Cancel any pending debounced save (used on shutdown)
+
+        AppState is already current after every change, so the caller's own
+        save_gui_state() writes everything; this only stops the timer.
+        """
+        if self._save_timer_id is not None:
+            self.after_cancel(self._save_timer_id)
+            self._save_timer_id = None
+
     def load_from_config(self):
         """Load values from AppState (GUI-only storage)"""
         # Load from AppState - this is loaded from gui_state.json
@@ -305,44 +448,20 @@ class CreatorSection(ctk.CTkFrame):
             else:
                 return  # No creators to load
 
-        # Batch creation for large lists to avoid blocking UI
-        if len(self.creators) > 20:
-            self._batch_create_widgets(self.creators, selected)
-        else:
-            # Small list - create immediately
-            for username in self.creators:
-                checked = username in selected
-                self.create_creator_row(username, checked=checked)
-            self.update_info_label()
-
-    def _batch_create_widgets(self, creators, selected):
-        """Create widgets in batches to avoid blocking UI"""
-        self._widget_creation_queue = list(creators)
-        self._selected_set = selected
-        self._create_next_batch()
-
-    def _create_next_batch(self, batch_size=10):
-        """Create next batch of widgets"""
-        for _ in range(batch_size):
-            if not self._widget_creation_queue:
-                self.update_info_label()
-                self._widget_creation_queue = None
-                self._selected_set = None
-                return
-            username = self._widget_creation_queue.pop(0)
-            checked = username in self._selected_set
-            self.create_creator_row(username, checked=checked)
-        
-        # Schedule next batch
-        if self._widget_creation_queue:
-            self.after(10, lambda: self._create_next_batch(batch_size))
-        else:
-            self.update_info_label()
-            self._widget_creation_queue = None
-            self._selected_set = None
+        self._creator_set = set(self.creators)
+        self._selected = {username for username in self.creators if username in selected}
+
+        # Only the visible rows are realized, so large lists load in one pass
+        self._render_rows()
+        self.update_info_label()
 
     def save_to_config(self, config):
         """Save values to AppState and GUI state file"""
+        # A full save supersedes any pending debounced one
+        if self._save_timer_id is not None:
+            self.after_cancel(self._save_timer_id)
+            self._save_timer_id = None
+
         # Save to AppState (session memory)
         self.app_state.all_creators = self.creators.copy()
         self.app_state.selected_creators = set(self.get_selected_creators())
@@ -358,13 +477,13 @@ class CreatorSection(ctk.CTkFrame):
         selected = self.get_selected_creators()
 
         if not selected:
-            self.info_label.configure(
+            self._set_info(
                 text="⚠ Select at least one creator to download", text_color="red"
             )
             return False
 
         count = len(selected)
-        self.info_label.configure(
+        self._set_info(
             text=f"Ready to download from {count} creator{'s' if count != 1 else ''}",
             text_color="green",
         )
@@ -377,7 +496,7 @@ class CreatorSection(ctk.CTkFrame):
 
         # Disable button during import
         self.import_subs_btn.configure(state="disabled", text="Importing...")
-        self.info_label.configure(text="Fetching subscriptions...", text_color="blue")
+        self._set_info(text="Fetching subscriptions...", text_color="blue")
 
         # Run in background thread to avoid blocking GUI
         def import_thread():
@@ -405,11 +524,11 @@ class CreatorSection(ctk.CTkFrame):
             self.load_from_config()
 
         message = f"Import complete!\n\nTotal subscriptions: {total}\nNew creators added: {added_count}\nAlready in list: {skipped_count}"
-        self.info_label.configure(text=f"✓ Imported {added_count} new creator{'s' if added_count != 1 else ''}", text_color="green")
+        self._set_info(text=f"✓ Imported {added_count} new creator{'s' if added_count != 1 else ''}", text_color="green")
         messagebox.showinfo("Subscriptions Imported", message)
 
     def _on_import_error(self, error_msg: str):
         """Handle import error"""
         self.import_subs_btn.configure(state="normal", text="Import Subscriptions")
-        self.info_label.configure(text="✗ Import failed", text_color="red")
+        self._set_info(text="✗ Import failed", text_color="red")
         messagebox.showerror("Import Failed", f"Failed to import subscriptions:\n\n{error_msg}")
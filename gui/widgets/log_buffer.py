@@ -0,0 +1,88 @@
+"""
+Buffered, color-tagged log output shared by the log widgets
+"""
+
+import time
+from collections import deque
+
+
+# Levels that have a color tag configured; anything else renders as info
+_LEVEL_TAGS = frozenset({"info", "warning", "error", "success"})
+
+
+class LogBufferMixin:
+    """
+    Queue add_log() calls and write them to self.log_text (a CTkTextbox)
+    in one insert per idle tick.
+
+    Widgets call _init_log_buffer() once self.log_text exists, and may
+    override _on_log_flushed() to trim or scroll after each flush.
+    """
+
+    def _init_log_buffer(self, maxlen=None):
+        """Configure the color tags and reset the message queue"""
+        self.log_text._textbox.tag_config("info", foreground="#5DADE2")
+        self.log_text._textbox.tag_config("warning", foreground="#F39C12")
+        self.log_text._textbox.tag_config("error", foreground="#E74C3C")
+        self.log_text._textbox.tag_config("success", foreground="#2ECC71")
+
+        # Messages waiting for the next idle flush
+        self._pending = deque(maxlen=maxlen)
+        self._flush_scheduled = False
+
+        # Timestamp string for the current second, reused across a burst
+        self._last_sec = None
+        self._last_ts = ""
+
+    def add_log(self, message, level="info"):
+        """
+        Add a log message with color coding.
+        level is a lowercase tag name ("info", "warning", "error" or "success").
+        """
+        now = int(time.time())
+        if now != self._last_sec:
+            self._last_sec = now
+            self._last_ts = time.strftime("%H:%M:%S", time.localtime(now))
+        formatted_message = f"[{self._last_ts}] {message}\n"
+
+        # Map level to tag (callers pass lowercase levels)
+        tag = level if level in _LEVEL_TAGS else "info"
+
+        # Queue and insert on the next idle tick so bursts share one update
+        self._pending.append((formatted_message, tag))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """Insert all queued messages in a single tag-interleaved insert"""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+
+        # Text.insert takes "chars, tags" pairs, so one call covers every
+        # message; consecutive same-tag lines are merged into one chunk.
+        # CTkTextbox.insert only accepts one chunk, so go to the inner Text.
+        args, run, run_tag = [], [], None
+        lines_added = 0
+        for formatted_message, tag in self._pending:
+            if tag != run_tag and run:
+                args += ("".join(run), run_tag)
+                run = []
+            run.append(formatted_message)
+            run_tag = tag
+            lines_added += formatted_message.count("\n")
+        args += ("".join(run), run_tag)
+        self.log_text._textbox.insert("end", *args)
+        self._pending.clear()
+
+        self._on_log_flushed(lines_added)
+
+    def _on_log_flushed(self, lines_added):
+        """Called after each flush; auto-scrolls to the bottom by default"""
+        self.log_text.see("end")
+
+    def _clear_log_buffer(self):
+        """Drop queued messages and empty the textbox"""
+        self._pending.clear()
+        self.log_text.delete("1.0", "end")
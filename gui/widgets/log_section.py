@@ -3,10 +3,10 @@ Console log display widget
 """
 
 import customtkinter as ctk
-from datetime import datetime
+from gui.widgets.log_buffer import LogBufferMixin
 
 
-class LogSection(ctk.CTkFrame):
+class LogSection(LogBufferMixin, ctk.CTkFrame):
     """Console log display section"""
     
     MAX_LOG_LINES = 1000
@@ -34,62 +34,48 @@ class LogSection(ctk.CTkFrame):
         )
         self.log_text.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # Configure text tags for colors
-        self.log_text._textbox.tag_config("info", foreground="#5DADE2")
-        self.log_text._textbox.tag_config("warning", foreground="#F39C12")
-        self.log_text._textbox.tag_config("error", foreground="#E74C3C")
-        self.log_text._textbox.tag_config("success", foreground="#2ECC71")
+        # Lines currently in the textbox, tracked here to avoid querying Tk
+        self._line_count = 0
 
-    def _is_scrolled_to_bottom(self):
-        """Check if user has scrolled to bottom of log"""
+        # Track manual scrolling from input events instead of polling the view
+        # on every message; auto-scroll stays on until the user scrolls up
+        self._user_scrolled = False
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>", "<Prior>", "<Next>"):
+            self.log_text._textbox.bind(sequence, self._on_user_scroll, add="+")
+        self.log_text._y_scrollbar.bind("<ButtonRelease-1>", self._on_user_scroll)
+
+        self._init_log_buffer(maxlen=self.MAX_LOG_LINES)
+
+    def _on_user_scroll(self, event=None):
+        """Re-check the scroll position after the user scrolls the log"""
+        # Runs after Tk has applied the scroll, so yview reflects the new view
+        self.after_idle(self._update_scroll_state)
+
+    def _update_scroll_state(self):
+        """Remember whether the user has scrolled away from the bottom"""
         try:
-            # Get current view position
-            top_index = self.log_text._textbox.index("@0,0")
-            bottom_index = self.log_text._textbox.index("@0,{}".format(self.log_text._textbox.winfo_height()))
-            end_index = self.log_text._textbox.index("end-1c")
-            
-            # Check if bottom of view is near end of text
-            top_line = int(top_index.split(".")[0])
-            bottom_line = int(bottom_index.split(".")[0])
-            end_line = int(end_index.split(".")[0])
-            
-            # Consider "at bottom" if within 3 lines of end
-            return (end_line - bottom_line) <= 3
+            self._user_scrolled = self.log_text._textbox.yview()[1] < 0.999
         except Exception:
             # If check fails, assume at bottom (safer default)
-            return True
-
-    def add_log(self, message, level="info"):
-        """Add a log message with color coding"""
-        # Check if user is at bottom before adding
-        is_at_bottom = self._is_scrolled_to_bottom()
-        
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
+            self._user_scrolled = False
 
-        # Map level to tag
-        tag = level.lower()
-        if tag not in ["info", "warning", "error", "success"]:
-            tag = "info"
-
-        # Insert with color
-        self.log_text.insert("end", formatted_message, tag)
+    def _on_log_flushed(self, lines_added):
+        """Trim to MAX_LOG_LINES and follow the bottom unless scrolled up"""
+        self._line_count += lines_added
 
         # Remove old lines if over limit
-        try:
-            line_count = int(self.log_text._textbox.index("end-1c").split(".")[0])
-            if line_count > self.MAX_LOG_LINES:
-                lines_to_remove = line_count - self.MAX_LOG_LINES
-                self.log_text._textbox.delete("1.0", f"{lines_to_remove}.0")
-        except Exception:
-            # If line counting fails, skip cleanup
-            pass
+        if self._line_count > self.MAX_LOG_LINES:
+            lines_to_remove = self._line_count - self.MAX_LOG_LINES
+            self.log_text._textbox.delete("1.0", f"{lines_to_remove + 1}.0")
+            self._line_count = self.MAX_LOG_LINES
 
-        # Only auto-scroll if user was at bottom
-        if is_at_bottom:
+        # Only auto-scroll if user hasn't scrolled up
+        if not self._user_scrolled:
             self.log_text.see("end")
 
     def clear_log(self):
         """Clear all log messages"""
-        self.log_text.delete("1.0", "end")
+        self._clear_log_buffer()
+        self._line_count = 0
+        self._user_scrolled = False
         self.add_log("Log cleared", "info")
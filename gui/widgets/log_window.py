@@ -3,15 +3,15 @@ Separate console log window
 """
 
 import customtkinter as ctk
-from datetime import datetime
 from gui.log_settings import (
     load_log_window_settings,
     save_log_window_settings,
     get_default_settings
 )
+from gui.widgets.log_buffer import LogBufferMixin
 
 
-class LogWindow(ctk.CTkToplevel):
+class LogWindow(LogBufferMixin, ctk.CTkToplevel):
     """Separate window for console log display"""
 
     def __init__(self, parent):
@@ -136,34 +136,11 @@ class LogWindow(ctk.CTkToplevel):
         )
         self.log_text.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # Configure text tags for colors
-        self.log_text._textbox.tag_config("info", foreground="#5DADE2")
-        self.log_text._textbox.tag_config("warning", foreground="#F39C12")
-        self.log_text._textbox.tag_config("error", foreground="#E74C3C")
-        self.log_text._textbox.tag_config("success", foreground="#2ECC71")
-
-    def add_log(self, message, level="info"):
-        """
-        Add a log message with color coding.
-        Same interface as LogSection for compatibility.
-        """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
-
-        # Map level to tag
-        tag = level.lower()
-        if tag not in ["info", "warning", "error", "success"]:
-            tag = "info"
-
-        # Insert with color
-        self.log_text.insert("end", formatted_message, tag)
-
-        # Auto-scroll to bottom
-        self.log_text.see("end")
+        self._init_log_buffer()
 
     def clear_log(self):
         """Clear all log messages"""
-        self.log_text.delete("1.0", "end")
+        self._clear_log_buffer()
         self.add_log("Log cleared", "info")
 
     def _on_always_on_top_toggle(self):
@@ -182,20 +159,27 @@ class LogWindow(ctk.CTkToplevel):
             if hasattr(self, '_configure_save_id'):
                 self.after_cancel(self._configure_save_id)
 
-            # Schedule save for 500ms from now
-            self._configure_save_id = self.after(500, self._save_window_state)
+            # Schedule save for 1s from now
+            self._configure_save_id = self.after(1000, self._save_window_state)
 
     def _save_window_state(self):
         """Save current window position, size, and visibility"""
         # Get current geometry
         self.update_idletasks()
 
-        self.settings["window_width"] = self.winfo_width()
-        self.settings["window_height"] = self.winfo_height()
-        self.settings["window_x"] = self.winfo_x()
-        self.settings["window_y"] = self.winfo_y()
-        self.settings["is_visible"] = self.winfo_viewable()
+        state = {
+            "window_width": self.winfo_width(),
+            "window_height": self.winfo_height(),
+            "window_x": self.winfo_x(),
+            "window_y": self.winfo_y(),
+            "is_visible": self.winfo_viewable(),
+        }
+
+        # Skip the file write if nothing moved (e.g. a click without a drag)
+        if all(self.settings.get(key) == value for key, value in state.items()):
+            return
 
+        self.settings.update(state)
         save_log_window_settings(self.settings)
 
     def _on_close(self):
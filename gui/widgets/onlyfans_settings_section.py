@@ -4,12 +4,39 @@ Simplified compared to Fansly - only shows what's actually implemented
 """
 
 import customtkinter as ctk
-import platform
-import subprocess
 from tkinter import filedialog
 from pathlib import Path
 
+from gui.file_manager import open_folder
 from gui.widgets.single_post_input import SinglePostInput
+from utils.url_parser import get_post_id_from_of_request
+
+
+# Default for config attributes that may be absent
+_MISSING = object()
+
+# Shared grid() options for the standard label/field rows
+_GRID_W = {"padx": 10, "pady": 5, "sticky": "w"}
+_GRID_EW = {"padx": 10, "pady": 5, "sticky": "ew"}
+
+# Widget constructors used by __init__, bound once at import
+_Label = ctk.CTkLabel
+_Frame = ctk.CTkFrame
+_Radio = ctk.CTkRadioButton
+_Check = ctk.CTkCheckBox
+_Entry = ctk.CTkEntry
+_Button = ctk.CTkButton
+_Slider = ctk.CTkSlider
+_BoolVar = ctk.BooleanVar
+_StrVar = ctk.StringVar
+
+
+def _set_check(check, value):
+    """Tick or untick a checkbox that has no Tk variable"""
+    if value:
+        check.select()
+    else:
+        check.deselect()
 
 
 class OnlyFansSettingsSection(ctk.CTkFrame):
@@ -19,126 +46,96 @@ class OnlyFansSettingsSection(ctk.CTkFrame):
         super().__init__(parent)
         self.config = config
 
+        # Last directory known to exist, so repeat clicks skip the filesystem
+        self._last_verified_dir = None
+
         # Title
-        title = ctk.CTkLabel(
+        title = _Label(
             self, text="Download Settings", font=("Arial", 16, "bold"), anchor="w"
         )
         title.grid(row=0, column=0, columnspan=4, padx=10, pady=(10, 5), sticky="w")
 
         # Download Mode Selection
-        mode_label = ctk.CTkLabel(self, text="Download Mode:", anchor="w")
-        mode_label.grid(row=1, column=0, padx=10, pady=5, sticky="w")
-
-        mode_frame = ctk.CTkFrame(self)
-        mode_frame.grid(row=1, column=1, columnspan=3, padx=10, pady=5, sticky="w")
-
-        self.mode_var = ctk.StringVar(value="Timeline")
-
-        self.normal_radio = ctk.CTkRadioButton(
-            mode_frame,
-            text="Normal",
-            variable=self.mode_var,
-            value="Normal",
-            command=self._on_mode_change
-        )
-        self.normal_radio.pack(side="left", padx=10)
-
-        self.timeline_radio = ctk.CTkRadioButton(
-            mode_frame,
-            text="Timeline",
-            variable=self.mode_var,
-            value="Timeline",
-            command=self._on_mode_change
-        )
-        self.timeline_radio.pack(side="left", padx=10)
-
-        self.messages_radio = ctk.CTkRadioButton(
-            mode_frame,
-            text="Messages",
-            variable=self.mode_var,
-            value="Messages",
-            command=self._on_mode_change
-        )
-        self.messages_radio.pack(side="left", padx=10)
-
-        self.single_radio = ctk.CTkRadioButton(
-            mode_frame,
-            text="Single Post",
-            variable=self.mode_var,
-            value="Single",
-            command=self._on_mode_change
-        )
-        self.single_radio.pack(side="left", padx=10)
-
-        # Single Post Input (shown only when Single mode selected)
-        self.single_post_frame = ctk.CTkFrame(self)
-        self.single_post_input = SinglePostInput(
-            self.single_post_frame,
-            platform="onlyfans"
-        )
-        self.single_post_input.pack(fill="x", padx=5, pady=5)
-        # Initially hidden
-        self.single_post_frame.grid(row=2, column=0, columnspan=4, padx=10, pady=5, sticky="ew")
-        self.single_post_frame.grid_remove()
+        mode_label = _Label(self, text="Download Mode:", anchor="w")
+        mode_label.grid(row=1, column=0, **_GRID_W)
+
+        mode_frame = _Frame(self)
+        mode_frame.grid(row=1, column=1, columnspan=3, **_GRID_W)
+
+        self.mode_var = _StrVar(value="Timeline")
+
+        for text, value in (
+            ("Normal", "Normal"),
+            ("Timeline", "Timeline"),
+            ("Messages", "Messages"),
+            ("Single Post", "Single"),
+        ):
+            radio = _Radio(
+                mode_frame,
+                text=text,
+                variable=self.mode_var,
+                value=value,
+                command=self._on_mode_change
+            )
+            radio.pack(side="left", padx=10)
+
+        # Single Post Input (built the first time Single mode is selected)
+        self.single_post_frame = None
+        self.single_post_input = None
 
         # Media Types
-        media_label = ctk.CTkLabel(self, text="Media Types:", anchor="w")
-        media_label.grid(row=3, column=0, padx=10, pady=5, sticky="w")
+        media_label = _Label(self, text="Media Types:", anchor="w")
+        media_label.grid(row=3, column=0, **_GRID_W)
 
-        media_frame = ctk.CTkFrame(self)
-        media_frame.grid(row=3, column=1, columnspan=2, padx=10, pady=5, sticky="w")
-
-        self.photos_var = ctk.BooleanVar(value=True)
-        self.photos_check = ctk.CTkCheckBox(
-            media_frame, text="Photos", variable=self.photos_var
-        )
-        self.photos_check.pack(side="left", padx=5)
+        media_frame = _Frame(self)
+        media_frame.grid(row=3, column=1, columnspan=2, **_GRID_W)
 
-        self.videos_var = ctk.BooleanVar(value=True)
-        self.videos_check = ctk.CTkCheckBox(
-            media_frame, text="Videos", variable=self.videos_var
-        )
-        self.videos_check.pack(side="left", padx=5)
+        # Checkboxes that are only read on save hold their own state
+        # instead of mirroring it in a Tk variable
+        self._media_checks = {}
+        for key, text in (("photos", "Photos"), ("videos", "Videos")):
+            check = _Check(media_frame, text=text)
+            check.select()
+            check.pack(side="left", padx=5)
+            self._media_checks[key] = check
 
         # Download Directory
-        dir_label = ctk.CTkLabel(self, text="Download Directory:", anchor="w")
-        dir_label.grid(row=4, column=0, padx=10, pady=5, sticky="w")
+        dir_label = _Label(self, text="Download Directory:", anchor="w")
+        dir_label.grid(row=4, column=0, **_GRID_W)
 
-        self.dir_entry = ctk.CTkEntry(self, width=300)
-        self.dir_entry.grid(row=4, column=1, padx=10, pady=5, sticky="ew")
+        self.dir_entry = _Entry(self, width=300)
+        self.dir_entry.grid(row=4, column=1, **_GRID_EW)
 
-        browse_btn = ctk.CTkButton(
+        browse_btn = _Button(
             self, text="Browse...", command=self.browse_directory, width=100
         )
         browse_btn.grid(row=4, column=2, padx=(10, 5), pady=5)
 
-        open_folder_btn = ctk.CTkButton(
+        open_folder_btn = _Button(
             self, text="Open Folder", command=self._open_download_folder, width=100
         )
         open_folder_btn.grid(row=4, column=3, padx=(0, 10), pady=5)
 
         # Options
-        options_label = ctk.CTkLabel(self, text="Options:", anchor="w")
+        options_label = _Label(self, text="Options:", anchor="w")
         options_label.grid(row=5, column=0, padx=10, pady=5, sticky="nw")
 
-        options_frame = ctk.CTkFrame(self)
-        options_frame.grid(row=5, column=1, columnspan=2, padx=10, pady=5, sticky="w")
+        options_frame = _Frame(self)
+        options_frame.grid(row=5, column=1, columnspan=2, **_GRID_W)
 
         # Incremental mode toggle
-        self.incremental_var = ctk.BooleanVar(value=False)
-        self.incremental_check = ctk.CTkCheckBox(
+        self.incremental_check = _Check(
             options_frame,
             text="Incremental mode (skip downloaded)",
-            variable=self.incremental_var,
         )
         self.incremental_check.pack(anchor="w", pady=2)
 
         # Post limit for new creators
-        post_limit_frame = ctk.CTkFrame(options_frame)
+        post_limit_frame = _Frame(options_frame)
         post_limit_frame.pack(anchor="w", pady=2, fill="x")
 
-        self.post_limit_var = ctk.BooleanVar(value=False)
-        self.post_limit_check = ctk.CTkCheckBox(
+        self.post_limit_var = _BoolVar(value=False)
+        self.post_limit_check = _Check(
             post_limit_frame,
             text="Limit posts for new creators:",
             variable=self.post_limit_var,
@@ -146,7 +143,7 @@ class OnlyFansSettingsSection(ctk.CTkFrame):
         )
         self.post_limit_check.pack(side="left", padx=(0, 5))
 
-        self.post_limit_entry = ctk.CTkEntry(
+        self.post_limit_entry = _Entry(
             post_limit_frame,
             width=80,
             placeholder_text="e.g. 100"
@@ -154,7 +151,7 @@ class OnlyFansSettingsSection(ctk.CTkFrame):
         self.post_limit_entry.pack(side="left", padx=5)
         self.post_limit_entry.configure(state="disabled")
 
-        post_limit_info = ctk.CTkLabel(
+        post_limit_info = _Label(
             post_limit_frame,
             text="(N newest posts for new creators)",
             font=("Arial", 9),
@@ -163,20 +160,20 @@ class OnlyFansSettingsSection(ctk.CTkFrame):
         post_limit_info.pack(side="left", padx=5)
 
         # Rate Limiting Section
-        rate_limit_label = ctk.CTkLabel(self, text="Rate Limiting:", anchor="w")
+        rate_limit_label = _Label(self, text="Rate Limiting:", anchor="w")
         rate_limit_label.grid(row=6, column=0, padx=10, pady=5, sticky="nw")
 
-        rate_limit_frame = ctk.CTkFrame(self)
-        rate_limit_frame.grid(row=6, column=1, columnspan=2, padx=10, pady=5, sticky="ew")
+        rate_limit_frame = _Frame(self)
+        rate_limit_frame.grid(row=6, column=1, columnspan=2, **_GRID_EW)
 
-        rate_limit_desc_label = ctk.CTkLabel(
+        rate_limit_desc_label = _Label(
             rate_limit_frame,
             text="Delay between requests:",
             font=("Arial", 11)
         )
         rate_limit_desc_label.pack(side="left", padx=5)
 
-        self.rate_limit_slider = ctk.CTkSlider(
+        self.rate_limit_slider = _Slider(
             rate_limit_frame,
             from_=0,
             to=10,
@@ -185,26 +182,27 @@ class OnlyFansSettingsSection(ctk.CTkFrame):
         )
         self.rate_limit_slider.pack(side="left", padx=10, fill="x", expand=True)
 
-        self.rate_limit_value_label = ctk.CTkLabel(
+        self.rate_limit_value_label = _Label(
             rate_limit_frame,
             text="2.0s",
             width=50
         )
         self.rate_limit_value_label.pack(side="left", padx=5)
+        self._last_rate_text = "2.0s"
+        self._rate_after_id = None
 
         # Auto-update setting (row 7)
-        auto_update_label = ctk.CTkLabel(self, text="Updates:", anchor="w")
-        auto_update_label.grid(row=7, column=0, padx=10, pady=5, sticky="w")
+        auto_update_label = _Label(self, text="Updates:", anchor="w")
+        auto_update_label.grid(row=7, column=0, **_GRID_W)
 
-        auto_update_frame = ctk.CTkFrame(self)
-        auto_update_frame.grid(row=7, column=1, columnspan=2, padx=10, pady=5, sticky="w")
+        auto_update_frame = _Frame(self)
+        auto_update_frame.grid(row=7, column=1, columnspan=2, **_GRID_W)
 
-        self.auto_update_var = ctk.BooleanVar(value=True)
-        self.auto_update_check = ctk.CTkCheckBox(
+        self.auto_update_check = _Check(
             auto_update_frame,
             text="Check for updates on startup",
-            variable=self.auto_update_var,
         )
+        self.auto_update_check.select()
         self.auto_update_check.pack(anchor="w", pady=2)
 
         # Configure grid weights
@@ -217,9 +215,18 @@ class OnlyFansSettingsSection(ctk.CTkFrame):
         """Handle download mode change"""
         mode = self.mode_var.get()
         if mode == "Single":
-            self.single_post_frame.grid()
+            if self.single_post_frame is None:
+                self.single_post_frame = _Frame(self)
+                self.single_post_input = SinglePostInput(
+                    self.single_post_frame,
+                    platform="onlyfans"
+                )
+                self.single_post_input.pack(fill="x", padx=5, pady=5)
+                self.single_post_frame.grid(row=2, column=0, columnspan=4, **_GRID_EW)
+            else:
+                self.single_post_frame.grid()
             self.single_post_input.focus()
-        else:
+        elif self.single_post_frame is not None:
             self.single_post_frame.grid_remove()
 
     def _on_post_limit_toggle(self):
@@ -243,73 +250,85 @@ class OnlyFansSettingsSection(ctk.CTkFrame):
             return
 
         folder = Path(path)
-        if not folder.exists():
-            folder.mkdir(parents=True, exist_ok=True)
+        if path == self._last_verified_dir and open_folder(folder):
+            return
 
-        if folder.exists():
-            system = platform.system()
-            if system == "Windows":
-                subprocess.run(["explorer", str(folder)], check=False)
-            elif system == "Darwin":
-                subprocess.run(["open", str(folder)], check=False)
-            else:
-                subprocess.run(["xdg-open", str(folder)], check=False)
+        # New path, or the cached one vanished (deleted, renamed, drive
+        # unplugged): recreate it before opening
+        self._last_verified_dir = None
+        try:
+            folder.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return
+        self._last_verified_dir = path
+        open_folder(folder)
 
     def _on_rate_limit_change(self, value):
+        """Slider callback: update the value label once dragging settles"""
+        if self._rate_after_id is not None:
+            self.after_cancel(self._rate_after_id)
+        self._rate_after_id = self.after(50, self._apply_rate_limit_label, value)
+
+    def _apply_rate_limit_label(self, value):
         """Update rate limit value label"""
-        self.rate_limit_value_label.configure(text=f"{value:.1f}s")
+        self._rate_after_id = None
+        # The slider reports every drag motion; only redraw on a new value
+        text = f"{value:.1f}s"
+        if text != self._last_rate_text:
+            self.rate_limit_value_label.configure(text=text)
+            self._last_rate_text = text
 
     def load_from_config(self):
         """Load values from config"""
-        # Download mode
-        if hasattr(self.config, 'download_mode') and self.config.download_mode:
-            self.mode_var.set(self.config.download_mode)
+        # OnlyFansConfig is a dataclass, so its fields need no hasattr probes
+        config = self.config
+
+        # Download mode (the layout only needs updating if it changed)
+        if config.download_mode and config.download_mode != self.mode_var.get():
+            self.mode_var.set(config.download_mode)
             self._on_mode_change()
 
-        # Directory
-        if self.config.download_directory:
-            self.dir_entry.insert(0, str(self.config.download_directory))
+        # Directory (left alone on reload when the entry already matches)
+        if config.download_directory:
+            new_path = str(config.download_directory)
+            if self.dir_entry.get() != new_path:
+                self.dir_entry.delete(0, "end")
+                self.dir_entry.insert(0, new_path)
 
         # Incremental mode
-        if hasattr(self.config, 'incremental_mode'):
-            self.incremental_var.set(self.config.incremental_mode)
+        _set_check(self.incremental_check, config.incremental_mode)
 
         # Media types
-        if hasattr(self.config, 'download_photos'):
-            self.photos_var.set(self.config.download_photos)
-        if hasattr(self.config, 'download_videos'):
-            self.videos_var.set(self.config.download_videos)
+        _set_check(self._media_checks["photos"], config.download_photos)
+        _set_check(self._media_checks["videos"], config.download_videos)
 
         # Rate limit
-        if hasattr(self.config, 'rate_limit_delay'):
-            self.rate_limit_slider.set(self.config.rate_limit_delay)
-            self._on_rate_limit_change(self.config.rate_limit_delay)
+        self.rate_limit_slider.set(config.rate_limit_delay)
+        self._apply_rate_limit_label(config.rate_limit_delay)
 
         # Post limit
-        if hasattr(self.config, 'max_posts_per_creator'):
-            if self.config.max_posts_per_creator is not None:
-                self.post_limit_var.set(True)
-                self.post_limit_entry.configure(state="normal")
-                self.post_limit_entry.delete(0, "end")
-                self.post_limit_entry.insert(0, str(self.config.max_posts_per_creator))
-            else:
-                self.post_limit_var.set(False)
-                self.post_limit_entry.configure(state="disabled")
+        if config.max_posts_per_creator is not None:
+            self.post_limit_var.set(True)
+            self.post_limit_entry.configure(state="normal")
+            self.post_limit_entry.delete(0, "end")
+            self.post_limit_entry.insert(0, str(config.max_posts_per_creator))
+        else:
+            self.post_limit_var.set(False)
+            self.post_limit_entry.configure(state="disabled")
 
-        # Auto-update
-        if hasattr(self.config, 'auto_check_updates'):
-            self.auto_update_var.set(self.config.auto_check_updates)
+        # Auto-update (not a dataclass field, only set once saved from here)
+        auto_check_updates = getattr(config, "auto_check_updates", _MISSING)
+        if auto_check_updates is not _MISSING:
+            _set_check(self.auto_update_check, auto_check_updates)
 
     def save_to_config(self, config):
         """Save values to config"""
-        from utils.url_parser import get_post_id_from_of_request
-
         # Set download mode based on selection
         mode = self.mode_var.get()
         config.download_mode = mode
 
         # If Single mode, get the post ID
-        if mode == "Single":
+        if mode == "Single" and self.single_post_input is not None:
             post_input = self.single_post_input.get_post_input()
             if post_input:
                 config.post_id = get_post_id_from_of_request(post_input)
@@ -324,11 +343,11 @@ class OnlyFansSettingsSection(ctk.CTkFrame):
             config.download_directory = Path(dir_path)
 
         # Incremental mode
-        config.incremental_mode = self.incremental_var.get()
+        config.incremental_mode = bool(self.incremental_check.get())
 
         # Media types
-        config.download_photos = self.photos_var.get()
-        config.download_videos = self.videos_var.get()
+        config.download_photos = bool(self._media_checks["photos"].get())
+        config.download_videos = bool(self._media_checks["videos"].get())
 
         # Rate limit
         config.rate_limit_delay = int(self.rate_limit_slider.get())
@@ -347,7 +366,7 @@ class OnlyFansSettingsSection(ctk.CTkFrame):
             config.max_posts_per_creator = None
 
         # Auto-update
-        config.auto_check_updates = self.auto_update_var.get()
+        config.auto_check_updates = bool(self.auto_update_check.get())
 
     def validate(self):
         """Validate settings"""
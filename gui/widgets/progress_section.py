@@ -3,11 +3,28 @@ Progress display widget
 """
 
 import customtkinter as ctk
+import time
+
+
+# Every key _flush_update tracks, so the state dict is sized up front and
+# can be indexed directly
+_INITIAL_LAST_UPDATE = {
+    'progress': None,
+    'percent_int': None,
+    'current_file': None,
+    'current_file_text': None,
+    'current_file_color': None,
+}
 
 
 class ProgressSection(ctk.CTkFrame):
     """Download progress display section"""
 
+    # Minimum seconds between file/stats label redraws while running
+    LABEL_INTERVAL = 0.1
+
+    STATS_IDLE_TEXT = "Downloaded: 0   Duplicates: 0   Speed: 0 MB/s"
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -32,80 +49,146 @@ class ProgressSection(ctk.CTkFrame):
         stats_frame = ctk.CTkFrame(self)
         stats_frame.grid(row=3, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
 
-        self.downloaded_label = ctk.CTkLabel(stats_frame, text="Downloaded: 0", anchor="w")
-        self.downloaded_label.pack(side="left", padx=10, pady=5)
-
-        self.duplicates_label = ctk.CTkLabel(stats_frame, text="Duplicates: 0", anchor="w")
-        self.duplicates_label.pack(side="left", padx=10, pady=5)
-
-        self.speed_label = ctk.CTkLabel(stats_frame, text="Speed: 0 MB/s", anchor="w")
-        self.speed_label.pack(side="left", padx=10, pady=5)
+        # One label for all stats, so a change costs a single redraw
+        self.stats_label = ctk.CTkLabel(stats_frame, text=self.STATS_IDLE_TEXT, anchor="w")
+        self.stats_label.pack(side="left", padx=10, pady=5)
+        self._last_stats_text = self.STATS_IDLE_TEXT
 
         # Configure grid weights
         self.grid_columnconfigure(0, weight=1)
         
         # Track last update state to avoid unnecessary widget updates
-        self._last_update = {}
+        self._last_update = dict(_INITIAL_LAST_UPDATE)
+
+        # Latest update waiting for the next idle flush
+        self._pending_update = None
+        self._flush_scheduled = False
+
+        # When the file/stats labels were last reconfigured, and the timer
+        # that redraws them once a throttled interval has passed
+        self._last_label_ts = 0.0
+        self._trailing_after_id = None
+
+        # Inputs of the last fully applied update, for a cheap no-op check
+        self._last_tuple = None
 
     def update_progress(self, update):
-        """Update progress display with ProgressUpdate data"""
+        """Queue a ProgressUpdate; bursts are collapsed into one redraw"""
+        self._pending_update = update
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_update)
+
+    def _flush_update(self):
+        """Apply the most recent queued ProgressUpdate to the widgets"""
+        self._flush_scheduled = False
+        update = self._pending_update
+        if update is None:
+            return
+        self._pending_update = None
+
+        # Bind the state and widgets used below to locals once per flush
+        last = self._last_update
+        status = update.status
+        file_name = update.current_file
+        downloaded = update.downloaded
+        duplicates = update.duplicates
+        bar = self.progress_bar
+
         # Calculate progress percentage
         progress_value = None
         if update.total > 0:
             progress_value = min(update.current / update.total, 1.0)
-        
+
+        # Most ticks repeat the previous update; skip them with one compare
+        speed_rounded = round(update.speed, 2) if update.speed > 0 else 0
+        new_tuple = (
+            progress_value, status, file_name, update.message,
+            downloaded, duplicates, speed_rounded,
+        )
+        if new_tuple == self._last_tuple:
+            return
+
         # Update progress bar only if changed
         if progress_value is not None:
-            last_progress = self._last_update.get('progress')
+            last_progress = last['progress']
             if last_progress != progress_value:
-                self.progress_bar.set(progress_value)
-                self._last_update['progress'] = progress_value
-        
-        # Update current file label only if changed
-        if update.total > 0:
-            percent = int(progress_value * 100)
-            new_text = f"[{percent}%] {update.current_file}" if update.current_file else f"Progress: {percent}%"
-            new_color = "white"
-        else:
-            new_text = f"Processing: {update.current_file}" if update.current_file else "Processing..."
-            new_color = "white"
+                bar.set(progress_value)
+                last['progress'] = progress_value
         
-        # Handle status changes
-        if update.status == "complete":
-            new_text = "Download complete!"
-            new_color = "green"
-            if self._last_update.get('progress') != 1.0:
-                self.progress_bar.set(1.0)
-                self._last_update['progress'] = 1.0
-        elif update.status == "error":
-            new_text = f"Error: {update.message[:50]}"
-            new_color = "red"
-        
-        # Only update label if text or color changed
-        last_text = self._last_update.get('current_file_text')
-        last_color = self._last_update.get('current_file_color')
-        if last_text != new_text or last_color != new_color:
-            self.current_file_label.configure(text=new_text, text_color=new_color)
-            self._last_update['current_file_text'] = new_text
-            self._last_update['current_file_color'] = new_color
-
-        # Update stats only if changed
-        if update.downloaded != self._last_update.get('downloaded'):
-            self.downloaded_label.configure(text=f"Downloaded: {update.downloaded}")
-            self._last_update['downloaded'] = update.downloaded
-        
-        if update.duplicates != self._last_update.get('duplicates'):
-            self.duplicates_label.configure(text=f"Duplicates: {update.duplicates}")
-            self._last_update['duplicates'] = update.duplicates
+        # Progress bar is always full once the download completes
+        if status == "complete" and last['progress'] != 1.0:
+            bar.set(1.0)
+            last['progress'] = 1.0
+
+        # The file and stats labels change almost every tick while running,
+        # so redraw them at most every LABEL_INTERVAL; final states always show
+        now = time.monotonic()
+        labels_due = (
+            status in ("complete", "error")
+            or now - self._last_label_ts >= self.LABEL_INTERVAL
+        )
 
-        # Update speed only if changed (round to avoid micro-updates)
-        speed_rounded = round(update.speed, 2) if update.speed > 0 else 0
-        if speed_rounded != self._last_update.get('speed'):
-            if speed_rounded > 0:
-                self.speed_label.configure(text=f"Speed: {speed_rounded:.2f} MB/s")
+        # Update current file label only if changed; while running, diff on
+        # the integer percent and file name before building any text
+        if labels_due:
+            percent_int = int(progress_value * 100) if progress_value is not None else None
+            if status == "complete":
+                new_text, new_color = "Download complete!", "green"
+                percent_int = current_file = None
+            elif status == "error":
+                new_text, new_color = f"Error: {update.message[:50]}", "red"
+                percent_int = current_file = None
+            elif percent_int == last['percent_int'] and file_name == last['current_file']:
+                new_text = None
             else:
-                self.speed_label.configure(text="Speed: 0 MB/s")
-            self._last_update['speed'] = speed_rounded
+                current_file = file_name
+                if percent_int is not None:
+                    new_text = f"[{percent_int}%] {current_file}" if current_file else f"Progress: {percent_int}%"
+                else:
+                    new_text = f"Processing: {current_file}" if current_file else "Processing..."
+                new_color = "white"
+
+            if new_text is not None and (
+                new_text != last['current_file_text']
+                or new_color != last['current_file_color']
+            ):
+                self.current_file_label.configure(text=new_text, text_color=new_color)
+                last['current_file_text'] = new_text
+                last['current_file_color'] = new_color
+                last['percent_int'] = percent_int
+                last['current_file'] = current_file
+                self._last_label_ts = now
+
+        # Update stats only if the combined text changed; held behind the
+        # same throttle so the label redraws at most once per interval
+        if labels_due:
+            speed_text = f"{speed_rounded:.2f} MB/s" if speed_rounded > 0 else "0 MB/s"
+            stats_text = f"Downloaded: {downloaded}   Duplicates: {duplicates}   Speed: {speed_text}"
+            if stats_text != self._last_stats_text:
+                self.stats_label.configure(text=stats_text)
+                self._last_stats_text = stats_text
+                self._last_label_ts = now
+
+        # Throttled label changes are still pending, so only remember the
+        # update once everything in it has been drawn; otherwise keep it
+        # queued and redraw when the interval is up, even if no newer
+        # update arrives by then
+        if labels_due:
+            self._last_tuple = new_tuple
+        else:
+            if self._pending_update is None:
+                self._pending_update = update
+            if self._trailing_after_id is None:
+                remaining = self.LABEL_INTERVAL - (now - self._last_label_ts)
+                self._trailing_after_id = self.after(
+                    max(1, int(remaining * 1000) + 1), self._flush_trailing
+                )
+
+    def _flush_trailing(self):
+        """Redraw labels held back by the throttle once their interval ends"""
+        self._trailing_after_id = None
+        self._flush_update()
 
     def reset(self):
         """Reset progress display"""
@@ -113,8 +196,12 @@ class ProgressSection(ctk.CTkFrame):
         self.current_file_label.configure(
             text="Ready to start", text_color="gray"
         )
-        self.downloaded_label.configure(text="Downloaded: 0")
-        self.duplicates_label.configure(text="Duplicates: 0")
-        self.speed_label.configure(text="Speed: 0 MB/s")
-        # Reset last update tracking
-        self._last_update = {}
+        self.stats_label.configure(text=self.STATS_IDLE_TEXT)
+        self._last_stats_text = self.STATS_IDLE_TEXT
+        # Reset last update tracking and drop any queued update
+        self._last_update = dict(_INITIAL_LAST_UPDATE)
+        self._last_tuple = None
+        self._pending_update = None
+        if self._trailing_after_id is not None:
+            self.after_cancel(self._trailing_after_id)
+            self._trailing_after_id = None
@@ -3,12 +3,38 @@ Download settings widget
 """
 
 import customtkinter as ctk
-import platform
-import subprocess
 from tkinter import filedialog
 from pathlib import Path
 
+from config.modes import DownloadMode
+from gui.file_manager import open_folder
 from gui.widgets.single_post_input import SinglePostInput
+from utils.common import get_post_id_from_request
+
+
+# Widget constructors used by __init__, bound once at import
+_Label = ctk.CTkLabel
+_Frame = ctk.CTkFrame
+_Radio = ctk.CTkRadioButton
+_Check = ctk.CTkCheckBox
+_Entry = ctk.CTkEntry
+_Button = ctk.CTkButton
+_BoolVar = ctk.BooleanVar
+_StrVar = ctk.StringVar
+
+# Default for config attributes that may be absent
+_MISSING = object()
+
+# Radio button value -> download mode
+_MODE_MAP = {
+    "normal": DownloadMode.NORMAL,
+    "timeline": DownloadMode.TIMELINE,
+    "messages": DownloadMode.MESSAGES,
+    "single": DownloadMode.SINGLE,
+}
+
+# Download mode -> radio button value (COLLECTION/NOTSET fall back to normal)
+_MODE_TO_KEY = {mode: key for key, mode in _MODE_MAP.items()}
 
 
 class SettingsSection(ctk.CTkFrame):
@@ -19,46 +45,46 @@ class SettingsSection(ctk.CTkFrame):
         self.config = config
 
         # Title
-        title = ctk.CTkLabel(
+        title = _Label(
             self, text="Download Settings", font=("Arial", 16, "bold"), anchor="w"
         )
         title.grid(row=0, column=0, columnspan=4, padx=10, pady=(10, 5), sticky="w")
 
         # Download Mode
-        mode_label = ctk.CTkLabel(self, text="Download Mode:", anchor="w")
+        mode_label = _Label(self, text="Download Mode:", anchor="w")
         mode_label.grid(row=1, column=0, padx=10, pady=5, sticky="w")
 
-        mode_frame = ctk.CTkFrame(self)
+        mode_frame = _Frame(self)
         mode_frame.grid(row=1, column=1, columnspan=3, padx=10, pady=5, sticky="w")
 
-        self.mode_var = ctk.StringVar(value="normal")
+        self.mode_var = _StrVar(value="normal")
 
-        self.normal_radio = ctk.CTkRadioButton(
+        self.normal_radio = _Radio(
             mode_frame, text="Normal", variable=self.mode_var, value="normal",
             command=self._on_mode_change
         )
         self.normal_radio.pack(side="left", padx=5)
 
-        self.timeline_radio = ctk.CTkRadioButton(
+        self.timeline_radio = _Radio(
             mode_frame, text="Timeline", variable=self.mode_var, value="timeline",
             command=self._on_mode_change
         )
         self.timeline_radio.pack(side="left", padx=5)
 
-        self.messages_radio = ctk.CTkRadioButton(
+        self.messages_radio = _Radio(
             mode_frame, text="Messages", variable=self.mode_var, value="messages",
             command=self._on_mode_change
         )
         self.messages_radio.pack(side="left", padx=5)
 
-        self.single_radio = ctk.CTkRadioButton(
+        self.single_radio = _Radio(
             mode_frame, text="Single Post", variable=self.mode_var, value="single",
             command=self._on_mode_change
         )
         self.single_radio.pack(side="left", padx=5)
 
         # Single Post Input (shown only when Single mode selected)
-        self.single_post_frame = ctk.CTkFrame(self)
+        self.single_post_frame = _Frame(self)
         self.single_post_input = SinglePostInput(
             self.single_post_frame,
             platform="fansly"
@@ -69,56 +95,56 @@ class SettingsSection(ctk.CTkFrame):
         self.single_post_frame.grid_remove()
 
         # Media Types
-        media_label = ctk.CTkLabel(self, text="Media Types:", anchor="w")
+        media_label = _Label(self, text="Media Types:", anchor="w")
         media_label.grid(row=3, column=0, padx=10, pady=5, sticky="w")
 
-        media_frame = ctk.CTkFrame(self)
+        media_frame = _Frame(self)
         media_frame.grid(row=3, column=1, columnspan=2, padx=10, pady=5, sticky="w")
 
-        self.photos_var = ctk.BooleanVar(value=True)
-        self.photos_check = ctk.CTkCheckBox(
+        self.photos_var = _BoolVar(value=True)
+        self.photos_check = _Check(
             media_frame, text="Photos", variable=self.photos_var
         )
         self.photos_check.pack(side="left", padx=5)
 
-        self.videos_var = ctk.BooleanVar(value=True)
-        self.videos_check = ctk.CTkCheckBox(
+        self.videos_var = _BoolVar(value=True)
+        self.videos_check = _Check(
             media_frame, text="Videos", variable=self.videos_var
         )
         self.videos_check.pack(side="left", padx=5)
 
         # Download Directory
-        dir_label = ctk.CTkLabel(self, text="Download Directory:", anchor="w")
+        dir_label = _Label(self, text="Download Directory:", anchor="w")
         dir_label.grid(row=4, column=0, padx=10, pady=5, sticky="w")
 
-        self.dir_entry = ctk.CTkEntry(self, width=300)
+        self.dir_entry = _Entry(self, width=300)
         self.dir_entry.grid(row=4, column=1, padx=10, pady=5, sticky="ew")
 
-        browse_btn = ctk.CTkButton(
+        browse_btn = _Button(
             self, text="Browse...", command=self.browse_directory, width=100
         )
         browse_btn.grid(row=4, column=2, padx=(10, 5), pady=5)
 
-        open_folder_btn = ctk.CTkButton(
+        open_folder_btn = _Button(
             self, text="Open Folder", command=self._open_download_folder, width=100
         )
         open_folder_btn.grid(row=4, column=3, padx=(0, 10), pady=5)
 
         # Options
-        options_label = ctk.CTkLabel(self, text="Options:", anchor="w")
+        options_label = _Label(self, text="Options:", anchor="w")
         options_label.grid(row=5, column=0, padx=10, pady=5, sticky="nw")
 
-        options_frame = ctk.CTkFrame(self)
+        options_frame = _Frame(self)
         options_frame.grid(row=5, column=1, columnspan=2, padx=10, pady=5, sticky="w")
 
-        self.preview_var = ctk.BooleanVar(value=False)
-        self.preview_check = ctk.CTkCheckBox(
+        self.preview_var = _BoolVar(value=False)
+        self.preview_check = _Check(
             options_frame, text="Download previews", variable=self.preview_var
         )
         self.preview_check.pack(anchor="w", pady=2)
 
-        self.separate_preview_var = ctk.BooleanVar(value=True)
-        self.separate_preview_check = ctk.CTkCheckBox(
+        self.separate_preview_var = _BoolVar(value=True)
+        self.separate_preview_check = _Check(
             options_frame,
             text="Separate previews folder",
             variable=self.separate_preview_var,
@@ -126,8 +152,8 @@ class SettingsSection(ctk.CTkFrame):
         self.separate_preview_check.pack(anchor="w", pady=2)
 
         # Incremental mode toggle
-        self.incremental_var = ctk.BooleanVar(value=False)
-        self.incremental_check = ctk.CTkCheckBox(
+        self.incremental_var = _BoolVar(value=False)
+        self.incremental_check = _Check(
             options_frame,
             text="Incremental mode (new content only)",
             variable=self.incremental_var,
@@ -135,11 +161,11 @@ class SettingsSection(ctk.CTkFrame):
         self.incremental_check.pack(anchor="w", pady=2)
 
         # Post limit for new creators
-        post_limit_frame = ctk.CTkFrame(options_frame)
+        post_limit_frame = _Frame(options_frame)
         post_limit_frame.pack(anchor="w", pady=2, fill="x")
 
-        self.post_limit_var = ctk.BooleanVar(value=False)
-        self.post_limit_check = ctk.CTkCheckBox(
+        self.post_limit_var = _BoolVar(value=False)
+        self.post_limit_check = _Check(
             post_limit_frame,
             text="Limit posts for new creators:",
             variable=self.post_limit_var,
@@ -147,7 +173,7 @@ class SettingsSection(ctk.CTkFrame):
         )
         self.post_limit_check.pack(side="left", padx=(0, 5))
 
-        self.post_limit_entry = ctk.CTkEntry(
+        self.post_limit_entry = _Entry(
             post_limit_frame,
             width=80,
             placeholder_text="e.g. 100"
@@ -155,7 +181,7 @@ class SettingsSection(ctk.CTkFrame):
         self.post_limit_entry.pack(side="left", padx=5)
         self.post_limit_entry.configure(state="disabled")
 
-        post_limit_info = ctk.CTkLabel(
+        post_limit_info = _Label(
             post_limit_frame,
             text="(N newest posts for new creators)",
             font=("Arial", 9),
@@ -164,8 +190,8 @@ class SettingsSection(ctk.CTkFrame):
         post_limit_info.pack(side="left", padx=5)
 
         # Auto-update setting
-        self.auto_update_var = ctk.BooleanVar(value=True)
-        self.auto_update_check = ctk.CTkCheckBox(
+        self.auto_update_var = _BoolVar(value=True)
+        self.auto_update_check = _Check(
             options_frame,
             text="Check for updates on startup",
             variable=self.auto_update_var,
@@ -208,92 +234,73 @@ class SettingsSection(ctk.CTkFrame):
             return
 
         folder = Path(path)
-        if not folder.exists():
-            # Try to create it or just open parent
+        try:
+            # Idempotent, so no separate exists() checks are needed
             folder.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return
 
-        if folder.exists():
-            system = platform.system()
-            if system == "Windows":
-                subprocess.run(["explorer", str(folder)], check=False)
-            elif system == "Darwin":
-                subprocess.run(["open", str(folder)], check=False)
-            else:
-                subprocess.run(["xdg-open", str(folder)], check=False)
+        open_folder(folder)
 
     def load_from_config(self):
         """Load values from config"""
+        config = self.config
+
         # Download mode
-        if hasattr(self.config, 'download_mode'):
-            mode_str = str(self.config.download_mode).lower()
-            if 'single' in mode_str:
-                self.mode_var.set("single")
-            elif 'timeline' in mode_str:
-                self.mode_var.set("timeline")
-            elif 'message' in mode_str:
-                self.mode_var.set("messages")
-            else:
-                self.mode_var.set("normal")
+        download_mode = getattr(config, 'download_mode', _MISSING)
+        if download_mode is not _MISSING:
+            key = _MODE_TO_KEY.get(download_mode)
+            if key is None and isinstance(download_mode, str):
+                # Legacy plain-string modes in any case, e.g. "Timeline"
+                key = _MODE_TO_KEY.get(download_mode.upper())
+            self.mode_var.set(key or "normal")
             self._on_mode_change()
 
-        # Directory
-        if self.config.download_directory:
-            self.dir_entry.insert(0, str(self.config.download_directory))
-
-        # Options
-        if hasattr(self.config, 'download_media_previews'):
-            self.preview_var.set(self.config.download_media_previews)
-
-        if hasattr(self.config, 'separate_previews'):
-            self.separate_preview_var.set(self.config.separate_previews)
-
-        if hasattr(self.config, 'incremental_mode'):
-            self.incremental_var.set(self.config.incremental_mode)
-
-        # Media types
-        if hasattr(self.config, 'download_photos'):
-            self.photos_var.set(self.config.download_photos)
-        if hasattr(self.config, 'download_videos'):
-            self.videos_var.set(self.config.download_videos)
+        # Directory (left alone on reload when the entry already matches)
+        if config.download_directory:
+            new_path = str(config.download_directory)
+            if self.dir_entry.get() != new_path:
+                self.dir_entry.delete(0, "end")
+                self.dir_entry.insert(0, new_path)
+
+        # Options and media types
+        for attr, var in (
+            ('download_media_previews', self.preview_var),
+            ('separate_previews', self.separate_preview_var),
+            ('incremental_mode', self.incremental_var),
+            ('download_photos', self.photos_var),
+            ('download_videos', self.videos_var),
+            ('auto_check_updates', self.auto_update_var),
+        ):
+            value = getattr(config, attr, _MISSING)
+            if value is not _MISSING:
+                var.set(value)
 
         # Post limit
-        if hasattr(self.config, 'max_posts_per_creator'):
-            if self.config.max_posts_per_creator is not None:
+        max_posts = getattr(config, 'max_posts_per_creator', _MISSING)
+        if max_posts is not _MISSING:
+            if max_posts is not None:
                 self.post_limit_var.set(True)
                 self.post_limit_entry.configure(state="normal")
                 self.post_limit_entry.delete(0, "end")
-                self.post_limit_entry.insert(0, str(self.config.max_posts_per_creator))
+                self.post_limit_entry.insert(0, str(max_posts))
             else:
                 self.post_limit_var.set(False)
                 self.post_limit_entry.configure(state="disabled")
 
-        # Auto-update
-        if hasattr(self.config, 'auto_check_updates'):
-            self.auto_update_var.set(self.config.auto_check_updates)
-
     def save_to_config(self, config):
         """Save values to config"""
-        from config.modes import DownloadMode
-        from utils.common import get_post_id_from_request
-
         # Download mode
         mode = self.mode_var.get()
+        config.download_mode = _MODE_MAP.get(mode, DownloadMode.NORMAL)
         if mode == "single":
-            config.download_mode = DownloadMode.SINGLE
             # Get post ID from input
             post_input = self.single_post_input.get_post_input()
             if post_input:
                 config.post_id = get_post_id_from_request(post_input)
             else:
                 config.post_id = None
-        elif mode == "timeline":
-            config.download_mode = DownloadMode.TIMELINE
-            config.post_id = None
-        elif mode == "messages":
-            config.download_mode = DownloadMode.MESSAGES
-            config.post_id = None
         else:
-            config.download_mode = DownloadMode.NORMAL
             config.post_id = None
 
         # Directory
@@ -3,6 +3,7 @@ Update notification banner widget
 """
 
 import customtkinter as ctk
+import time
 import tkinter.messagebox as messagebox
 from typing import Callable, Optional
 
@@ -132,6 +133,9 @@ class UpdateBanner(ctk.CTkFrame):
 class DownloadProgressBanner(ctk.CTkFrame):
     """Download progress banner showing update download status"""
 
+    # Minimum seconds between redraws (~15 Hz) while the percent is unchanged
+    REDRAW_INTERVAL = 0.066
+
     def __init__(
         self,
         parent,
@@ -147,6 +151,11 @@ class DownloadProgressBanner(ctk.CTkFrame):
         super().__init__(parent, fg_color="#1a5fb4")  # Blue background
 
         self.on_cancel = on_cancel
+
+        # Last redraw time and percent, used to throttle update_progress
+        self._last_update_ts = 0.0
+        self._last_percent = -1
+
         self._build_ui()
 
     def _build_ui(self):
@@ -216,8 +225,21 @@ class DownloadProgressBanner(ctk.CTkFrame):
             progress = downloaded / total
             percent = int(progress * 100)
 
+            # Byte callbacks can fire hundreds of times a second; redraw at a
+            # capped rate unless the percent moved or the download finished
+            now = time.monotonic()
+            if (
+                now - self._last_update_ts < self.REDRAW_INTERVAL
+                and downloaded != total
+                and percent == self._last_percent
+            ):
+                return
+            self._last_update_ts = now
+
             self.progress_bar.set(progress)
-            self.percent_label.configure(text=f"{percent}%")
+            if percent != self._last_percent:
+                self.percent_label.configure(text=f"{percent}%")
+                self._last_percent = percent
 
             # Show size
             downloaded_mb = downloaded / (1024 * 1024)
@@ -230,6 +252,7 @@ class DownloadProgressBanner(ctk.CTkFrame):
         """Show download complete state"""
         self.progress_bar.set(1.0)
         self.percent_label.configure(text="100%")
+        self._last_percent = 100
         self.status_label.configure(text="Download complete!")
 
     def set_error(self, message: str = "Download failed"):
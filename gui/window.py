@@ -200,9 +200,11 @@ class MainWindow(ctk.CTk):
         if self.log_window is not None:
             self.log_window._save_window_state()
 
-        # Save GUI state before closing
+        # Drop pending debounced creator saves, then save GUI state once
+        self.sections["creator"].cancel_pending_save()
         self.app_state.save_gui_state()
         if self.of_app_state is not None:
+            self.of_sections["creator"].cancel_pending_save()
             self.of_app_state.save_gui_state()
         
         # Destroy window
@@ -0,0 +1,26 @@
+"""Tests for pulling the Fansly token out of pasted input."""
+
+import json
+import unittest
+
+from gui.widgets.auth_section import _extract_token
+
+
+class ExtractTokenTests(unittest.TestCase):
+    def test_plain_token_is_returned_unchanged(self):
+        self.assertEqual(_extract_token("abc123"), "abc123")
+
+    def test_token_is_read_from_json_blob(self):
+        self.assertEqual(_extract_token('{"id": 1, "token": "abc/123=="}'), "abc/123==")
+
+    def test_escaped_token_is_decoded(self):
+        self.assertEqual(_extract_token('{"token": "a\\"b"}'), 'a"b')
+        self.assertEqual(_extract_token(json.dumps({"token": "ab/cd"}).replace("/", "\\/")), "ab/cd")
+
+    def test_non_dict_or_invalid_json_is_returned_unchanged(self):
+        self.assertEqual(_extract_token('{not json}'), '{not json}')
+        self.assertEqual(_extract_token('{"token": 5}'), '{"token": 5}')
+
+
+if __name__ == "__main__":
+    unittest.main()
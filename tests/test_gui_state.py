@@ -0,0 +1,55 @@
+"""Tests for GUI state snapshot + delta log persistence."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from gui.state import (
+    append_state_delta,
+    clear_state_deltas,
+    delta_file_for,
+    read_state_with_deltas,
+)
+
+
+class GuiStateDeltaTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.state_file = Path(self._tmp.name) / "gui_state.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_deltas_replay_over_snapshot_in_order(self):
+        self.state_file.write_text(
+            json.dumps({"creators": ["alice", "bob"], "selected": ["alice"]}),
+            encoding="utf-8",
+        )
+        append_state_delta(self.state_file, "selected", ["bob"])
+        append_state_delta(self.state_file, "selected", ["alice", "bob"])
+
+        state = read_state_with_deltas(self.state_file)
+
+        self.assertEqual(state["creators"], ["alice", "bob"])
+        self.assertEqual(state["selected"], ["alice", "bob"])
+        self.assertEqual(delta_file_for(self.state_file).name, "gui_state.delta.jsonl")
+
+    def test_truncated_delta_line_is_skipped(self):
+        append_state_delta(self.state_file, "selected", ["alice"])
+        with open(delta_file_for(self.state_file), "a", encoding="utf-8") as f:
+            f.write('{"k": "selected", "v": ["bo')
+
+        self.assertEqual(read_state_with_deltas(self.state_file), {"selected": ["alice"]})
+
+    def test_clear_removes_delta_log(self):
+        append_state_delta(self.state_file, "selected", [])
+        clear_state_deltas(self.state_file)
+        clear_state_deltas(self.state_file)  # No error when already gone
+
+        self.assertFalse(delta_file_for(self.state_file).exists())
+        self.assertEqual(read_state_with_deltas(self.state_file), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
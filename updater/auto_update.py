@@ -33,7 +33,9 @@ PROTECTED_UPDATE_FILES = (
     "config.ini",
     "onlyfans_config.ini",
     "gui_state.json",
+    "gui_state.delta.jsonl",
     "onlyfans_gui_state.json",
+    "onlyfans_gui_state.delta.jsonl",
     "log_window_settings.json",
 )
 